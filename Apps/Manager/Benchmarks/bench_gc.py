@@ -0,0 +1,133 @@
+# Retention GC benchmark: build a synthetic Recordings tree and time
+# storage.rotate_by_age over it.
+#
+#   python Apps/Manager/Benchmarks/bench_gc.py --files 1000000 --expired 0.1 \
+#       --output gc.json
+#
+# Files are empty; the layout mirrors real ingest
+# (<system>/<user>/<YYYY-MM-DD>/<segment>.mkv) and a fraction of them get an
+# mtime past the retention cutoff. Building millions of files takes a while, so
+# --root together with --reuse lets a tree be built once and measured again
+# (the expired files are recreated before each timed sweep).
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+if __package__ in (None, ""):  # running as a script: ensure Apps/ is on sys.path
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from Manager import storage
+from Manager.Benchmarks import common
+
+_RETENTION = timedelta(days=7)
+
+
+def _layout(files: int, systems: int, users: int, days: int) -> List[Path]:
+    per_dir = max(1, files // (systems * users * days))
+    today = datetime.utcnow().date()
+    paths: List[Path] = []
+    for i in range(files):
+        bucket = i // per_dir
+        system = bucket % systems
+        user = (bucket // systems) % users
+        day = today - timedelta(days=(bucket // (systems * users)) % days)
+        paths.append(
+            Path(f"PC-{system:05d}")
+            / f"user{user:03d} - s1"
+            / f"{day:%Y-%m-%d}"
+            / f"desktop_{i:09d}.mkv"
+        )
+    return paths
+
+
+def _build(root: Path, paths: List[Path], expired_every: int) -> int:
+    """Create any missing files; every Nth one is back-dated. Returns expired."""
+    old = time.time() - _RETENTION.total_seconds() - 3600
+    made_dirs = set()
+    expired = 0
+    for i, rel in enumerate(paths):
+        p = root / rel
+        parent = p.parent
+        if parent not in made_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(parent)
+        is_expired = expired_every > 0 and i % expired_every == 0
+        if not p.exists():
+            p.touch()
+        if is_expired:
+            os.utime(p, (old, old))
+            expired += 1
+    return expired
+
+
+def run(args: argparse.Namespace) -> Dict:
+    cleanup = args.root is None
+    root = Path(args.root or tempfile.mkdtemp(prefix="srs-bench-gc-")) / "Recordings"
+    if root.exists() and not args.reuse:
+        raise SystemExit(f"{root} already exists; pass --reuse to build on top of it")
+
+    expired_every = int(round(1 / args.expired)) if args.expired > 0 else 0
+    paths = _layout(args.files, args.systems, args.users, args.days)
+
+    build_started = time.perf_counter()
+    expired = _build(root, paths, expired_every)
+    build_elapsed = time.perf_counter() - build_started
+
+    sweep_started = time.perf_counter()
+    deleted = storage.rotate_by_age(root, _RETENTION)
+    sweep_elapsed = time.perf_counter() - sweep_started
+
+    remaining = common.tree_usage(root)["files"]
+    if cleanup:
+        shutil.rmtree(root.parent, ignore_errors=True)
+
+    return {
+        "benchmark": "gc",
+        "params": {
+            "files": args.files,
+            "expired_fraction": args.expired,
+            "systems": args.systems,
+            "users": args.users,
+            "days": args.days,
+        },
+        "build_s": round(build_elapsed, 3),
+        "expired_files": expired,
+        "deleted": deleted,
+        "remaining_files": remaining,
+        "rotate_s": round(sweep_elapsed, 3),
+        "files_per_s": round(args.files / sweep_elapsed, 1) if sweep_elapsed else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time rotate_by_age over a synthetic recordings tree."
+    )
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument(
+        "--expired", type=float, default=0.1, help="fraction of files past retention"
+    )
+    parser.add_argument("--systems", type=int, default=200)
+    parser.add_argument("--users", type=int, default=2)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument(
+        "--root", help="build the tree here instead of a temporary directory"
+    )
+    parser.add_argument(
+        "--reuse", action="store_true", help="reuse an existing tree under --root"
+    )
+    parser.add_argument("--output", help="also write the JSON results here")
+    args = parser.parse_args()
+    common.emit_results(run(args), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+# Simulated recorder fleet hammering /upload on a real Manager instance.
+#
+#   python Apps/Manager/Benchmarks/bench_ingest.py --recorders 50 --rounds 5 \
+#       --segment-size 8MB --output ingest.json
+#
+# The Manager runs in a child process (uvicorn + the real FastAPI app) against
+# a throwaway Manager.ini and storage root, so its CPU time can be measured on
+# its own. Each round every recorder waits on a shared barrier and then uploads
+# one segment, reproducing the burst at a segment boundary; --jitter spreads
+# the burst out. Like the C# recorder, every upload opens a new connection.
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List
+
+if __package__ in (None, ""):  # running as a script: ensure Apps/ is on sys.path
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from Manager.Benchmarks import common
+from Manager.config import _parse_size
+
+_AUTH_TOKEN = "bench-token"
+
+
+def _serve(port: int) -> None:
+    """Child-process entry point: run the Manager until stdin closes."""
+    import uvicorn
+
+    from Manager.server import app
+
+    server = uvicorn.Server(
+        uvicorn.Config(
+            app,
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+            loop="asyncio",
+            lifespan="on",
+        )
+    )
+
+    baseline = {"times": os.times()}
+
+    def _wait_for_parent() -> None:
+        # Exclude interpreter start-up and imports from the CPU figures.
+        while not server.started:
+            time.sleep(0.05)
+        baseline["times"] = os.times()
+        sys.stdin.read()
+        server.should_exit = True
+
+    threading.Thread(target=_wait_for_parent, daemon=True).start()
+    server.run()
+    times = os.times()
+    start = baseline["times"]
+    print(
+        json.dumps(
+            {
+                "cpu_user": times.user - start.user,
+                "cpu_system": times.system - start.system,
+            }
+        )
+    )
+    sys.stdout.flush()
+
+
+def _wait_until_listening(port: int, proc: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("Manager process exited during startup")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/docs")
+            conn.getresponse().read()
+            conn.close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Manager did not start listening on port {port}")
+
+
+def _multipart_body(
+    boundary: str, system_name: str, recording_user: str, filename: str, payload: bytes
+) -> bytes:
+    head = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="systemName"\r\n\r\n'
+        f"{system_name}\r\n"
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="recordingUser"\r\n\r\n'
+        f"{recording_user}\r\n"
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode("utf-8")
+    tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+    return head + payload + tail
+
+
+def _upload_once(port: int, recorder: int, seq: int, payload: bytes) -> float:
+    boundary = uuid.uuid4().hex
+    body = _multipart_body(
+        boundary,
+        system_name=f"bench-{recorder:04d}",
+        recording_user="bench - s1",
+        filename=f"desktop_{recorder:04d}_{seq:06d}.mkv",
+        payload=payload,
+    )
+    started = time.perf_counter()
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=300)
+    try:
+        conn.request(
+            "POST",
+            "/upload",
+            body=body,
+            headers={
+                "Authorization": f"Bearer {_AUTH_TOKEN}",
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+            },
+        )
+        resp = conn.getresponse()
+        resp.read()
+        if resp.status != 200:
+            raise RuntimeError(f"HTTP {resp.status}")
+    finally:
+        conn.close()
+    return time.perf_counter() - started
+
+
+def run(args: argparse.Namespace) -> Dict:
+    segment_size = _parse_size(args.segment_size)
+    payload = os.urandom(segment_size)
+    port = common.free_port()
+    work_dir = Path(tempfile.mkdtemp(prefix="srs-bench-ingest-"))
+    storage_root = work_dir / "Recordings"
+    ini_path = common.write_manager_ini(
+        work_dir / "Manager.ini", port, storage_root, _AUTH_TOKEN
+    )
+
+    env = dict(os.environ, SRS_MANAGER_INI=str(ini_path))
+    proc = subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "--serve", str(port)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        env=env,
+        text=True,
+    )
+
+    latencies: List[float] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(args.recorders)
+
+    def _recorder(idx: int) -> None:
+        rng = random.Random(idx)
+        for seq in range(args.rounds):
+            barrier.wait()
+            if args.jitter > 0:
+                time.sleep(rng.uniform(0, args.jitter))
+            try:
+                elapsed = _upload_once(port, idx, seq, payload)
+                with lock:
+                    latencies.append(elapsed)
+            except Exception as exc:
+                with lock:
+                    errors.append(str(exc))
+            if args.interval > 0:
+                time.sleep(args.interval)
+
+    try:
+        _wait_until_listening(port, proc, timeout=30)
+        threads = [
+            threading.Thread(target=_recorder, args=(i,), daemon=True)
+            for i in range(args.recorders)
+        ]
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        stdout, _ = proc.communicate(timeout=60)
+
+    server_cpu = {"cpu_user": 0.0, "cpu_system": 0.0}
+    for line in reversed(stdout.splitlines()):
+        if line.startswith("{"):
+            server_cpu = json.loads(line)
+            break
+
+    usage = common.tree_usage(storage_root)
+    if not args.keep:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    ok = len(latencies)
+    cpu_total = server_cpu["cpu_user"] + server_cpu["cpu_system"]
+    return {
+        "benchmark": "ingest",
+        "params": {
+            "recorders": args.recorders,
+            "rounds": args.rounds,
+            "segment_size": segment_size,
+            "jitter_s": args.jitter,
+            "interval_s": args.interval,
+        },
+        "requests": ok + len(errors),
+        "errors": len(errors),
+        "error_samples": errors[:5],
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(ok / elapsed, 2) if elapsed else 0.0,
+        "throughput_mib_s": (
+            round(ok * segment_size / elapsed / 1024**2, 2) if elapsed else 0.0
+        ),
+        "latency_ms": {
+            "p50": round(common.percentile(latencies, 50) * 1000, 2),
+            "p99": round(common.percentile(latencies, 99) * 1000, 2),
+            "max": round(max(latencies, default=0.0) * 1000, 2),
+            "mean": round(sum(latencies) / ok * 1000, 2) if ok else 0.0,
+        },
+        "server_cpu_s": {
+            "user": round(server_cpu["cpu_user"], 3),
+            "system": round(server_cpu["cpu_system"], 3),
+        },
+        "server_cpu_pct": round(cpu_total / elapsed * 100, 1) if elapsed else 0.0,
+        "disk": {
+            "files_stored": usage["files"],
+            "bytes_stored": usage["bytes"],
+            "write_mib_s": round(usage["bytes"] / elapsed / 1024**2, 2)
+            if elapsed
+            else 0.0,
+        },
+    }
+
+
+def main() -> None:
+    if len(sys.argv) > 2 and sys.argv[1] == "--serve":
+        _serve(int(sys.argv[2]))
+        return
+
+    parser = argparse.ArgumentParser(
+        description="Upload benchmark for a simulated recorder fleet."
+    )
+    parser.add_argument("--recorders", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3, help="segments per recorder")
+    parser.add_argument("--segment-size", default="4MB")
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=0.0,
+        help="spread each burst uniformly over this many seconds",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=0.0, help="pause between rounds (seconds)"
+    )
+    parser.add_argument("--output", help="also write the JSON results here")
+    parser.add_argument(
+        "--keep", action="store_true", help="keep the temporary storage root"
+    )
+    args = parser.parse_args()
+    common.emit_results(run(args), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# Manager cold-start benchmark and import-time budget check.
+#
+#   python Apps/Manager/Benchmarks/bench_startup.py --runs 5 --output startup.json
+#   python Apps/Manager/Benchmarks/bench_startup.py --check --budget-ms 250
+#
+# Every measurement runs in a fresh interpreter. It reports:
+#   - time to "import Manager" and "import Manager.main";
+#   - which heavy modules (uvicorn, FastAPI, pywin32, the server app) and
+#     threads those imports leave behind; both should be empty, because they
+#     are deferred until the run mode is known;
+#   - time from launching "main.py --console" to the port accepting
+#     connections, against a throwaway Manager.ini.
+# With --check the script exits non-zero when the median "import Manager.main"
+# time exceeds --budget-ms or when an import pulls in heavy modules or threads.
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+if __package__ in (None, ""):  # running as a script: ensure Apps/ is on sys.path
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from Manager.Benchmarks import common
+
+_APPS_DIR = Path(__file__).resolve().parents[2]
+_MAIN_PY = _APPS_DIR / "Manager" / "main.py"
+_HEAVY_MODULES = (
+    "uvicorn",
+    "fastapi",
+    "starlette",
+    "python_multipart",
+    "win32serviceutil",
+    "servicemanager",
+    "Manager.server",
+)
+
+_PROBE = """
+import json, sys, threading, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "heavy": [m for m in {heavy!r} if m in sys.modules],
+    "threads": [
+        t.name for t in threading.enumerate() if t is not threading.main_thread()
+    ],
+}}))
+"""
+
+
+def _probe_import(module: str, env: Dict[str, str]) -> Dict:
+    code = _PROBE.format(module=module, heavy=_HEAVY_MODULES)
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=_APPS_DIR,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _time_to_listen(port: int, env: Dict[str, str], timeout: float = 60.0) -> float:
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, str(_MAIN_PY), "--console"],
+        cwd=_APPS_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError("Manager exited during startup")
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                    return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f"Manager did not listen on port {port} within {timeout}s")
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    return {
+        "median": round(statistics.median(values), 1),
+        "min": round(min(values), 1),
+        "max": round(max(values), 1),
+    }
+
+
+def run(args: argparse.Namespace) -> Dict:
+    work_dir = Path(tempfile.mkdtemp(prefix="srs-bench-startup-"))
+    port = common.free_port()
+    ini_path = common.write_manager_ini(
+        work_dir / "Manager.ini", port, work_dir / "Recordings", "bench-token"
+    )
+    env = dict(os.environ, SRS_MANAGER_INI=str(ini_path), PYTHONPATH=str(_APPS_DIR))
+
+    imports: Dict[str, List[Dict]] = {"Manager": [], "Manager.main": []}
+    ready_ms: List[float] = []
+    try:
+        for _ in range(args.runs):
+            for module in imports:
+                imports[module].append(_probe_import(module, env))
+            if not args.skip_listen:
+                ready_ms.append(_time_to_listen(port, env) * 1000)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    results: Dict = {"benchmark": "startup", "params": {"runs": args.runs}}
+    for module, probes in imports.items():
+        results[f"import {module}"] = {
+            "ms": _summary([p["ms"] for p in probes]),
+            "heavy_modules": sorted({m for p in probes for m in p["heavy"]}),
+            "threads": sorted({t for p in probes for t in p["threads"]}),
+        }
+    if ready_ms:
+        results["console_ready_ms"] = _summary(ready_ms)
+    return results
+
+
+def _check(results: Dict, budget_ms: float) -> List[str]:
+    problems = []
+    for key in ("import Manager", "import Manager.main"):
+        entry = results[key]
+        if entry["heavy_modules"]:
+            problems.append(f"{key} imported {', '.join(entry['heavy_modules'])}")
+        if entry["threads"]:
+            problems.append(f"{key} started threads: {', '.join(entry['threads'])}")
+    median = results["import Manager.main"]["ms"]["median"]
+    if median > budget_ms:
+        problems.append(
+            f"import Manager.main took {median}ms (budget {budget_ms}ms)"
+        )
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure Manager import and cold-start time."
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--skip-listen",
+        action="store_true",
+        help="only measure imports, not time until the port is listening",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit non-zero if the import budget or laziness checks fail",
+    )
+    parser.add_argument("--budget-ms", type=float, default=250.0)
+    parser.add_argument("--output", help="also write the JSON results here")
+    args = parser.parse_args()
+
+    results = run(args)
+    common.emit_results(results, args.output)
+    if args.check:
+        problems = _check(results, args.budget_ms)
+        for problem in problems:
+            print(f"FAIL: {problem}", file=sys.stderr)
+        sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
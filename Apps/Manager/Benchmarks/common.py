@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import math
+import platform
+import socket
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; returns 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(pct / 100.0 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def free_port(host: str = "127.0.0.1") -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind((host, 0))
+        return s.getsockname()[1]
+
+
+def tree_usage(root: Path) -> Dict[str, int]:
+    files = 0
+    size = 0
+    for p in root.rglob("*"):
+        try:
+            if p.is_file():
+                files += 1
+                size += p.stat().st_size
+        except OSError:
+            continue
+    return {"files": files, "bytes": size}
+
+
+def write_manager_ini(
+    path: Path,
+    port: int,
+    hot_root: Path,
+    auth_token: str,
+    extra_lines: Iterable[str] = (),
+) -> Path:
+    """Write a throwaway Manager.ini for benchmark runs."""
+    lines = [
+        "[manager]",
+        "bind_host = 127.0.0.1",
+        f"bind_port = {port}",
+        f"auth_token = {auth_token}",
+        "gc_interval = 24h",
+        "retention = 30d",
+        "",
+        "[tiering]",
+        f"hot_root = {hot_root}",
+        "",
+        "[scrub]",
+        "interval = 0",
+        *extra_lines,
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def emit_results(results: Dict[str, Any], output: Optional[str]) -> None:
+    """
+    Print results as JSON and optionally write them to a file so runs can be
+    compared before/after a change.
+    """
+    results = {
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        **results,
+    }
+    text = json.dumps(results, indent=2, sort_keys=False)
+    if output:
+        Path(output).write_text(text + "\n", encoding="utf-8")
+    print(text)
@@ -1,5 +1,19 @@
-from . import auth
-from . import storage
-from . import config
+import importlib
 
-__all__ = ["auth", "storage", "config"]
+__all__ = [
+    "auth",
+    "batch",
+    "storage",
+    "config",
+    "scrub",
+    "tiering",
+    "timing",
+]
+
+
+def __getattr__(name: str):
+    # Submodules are imported on first access so that "import Manager" (and the
+    # frozen service's start-up) does not pay for FastAPI and friends up front.
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # pragma: no cover - older python-multipart releases
+    from multipart.multipart import MultipartParser, parse_options_header
+
+from . import storage, timing
+
+_LOGGER = logging.getLogger("manager.batch")
+_MAX_FIELD_BYTES = 1024
+_FIELDS = {"systemName", "recordingUser"}
+
+
+def multipart_boundary(content_type: str | None) -> Optional[bytes]:
+    """Return the boundary of a multipart/form-data Content-Type, if any."""
+    if not content_type:
+        return None
+    ctype, params = parse_options_header(content_type)
+    if ctype != b"multipart/form-data":
+        return None
+    return params.get(b"boundary")
+
+
+class BatchUpload:
+    """
+    Streaming multipart/form-data ingest for many segments in one request.
+
+    The systemName and recordingUser fields apply to every file part that
+    follows them (they may be repeated to switch identity mid-stream); a file
+    part sent before both fields is rejected, as /upload would. Each file
+    part is written to the staging area as its bytes arrive and committed
+    when the part ends, so memory use stays flat however large the batch is.
+    feed() raises the parser's error on malformed input; files committed
+    before that point are kept.
+    """
+
+    def __init__(
+        self,
+        storage_root: str | os.PathLike,
+        boundary: bytes,
+        allowed_exts: Iterable[str],
+    ) -> None:
+        self._root = Path(storage_root)
+        self._allowed = {e.lower() for e in allowed_exts}
+        self._fields: Dict[str, str] = {}
+        self.results: List[Dict[str, Any]] = []
+
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: Dict[bytes, bytes] = {}
+        self._field_name: Optional[str] = None
+        self._field_value = bytearray()
+        self._filename: Optional[str] = None
+        self._writer: Optional[storage.StagedUpload] = None
+        self._error: Optional[str] = None
+
+        self._parser = MultipartParser(
+            boundary,
+            callbacks={
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+
+    def feed(self, chunk: bytes) -> None:
+        self._parser.write(chunk)
+
+    def finish(self) -> List[Dict[str, Any]]:
+        self._parser.finalize()
+        self.abort()
+        return self.results
+
+    def abort(self) -> None:
+        """Discard a file part that was still being written."""
+        if self._writer is not None:
+            self._writer.abort()
+            self._writer = None
+            self._record_failure("upload interrupted")
+
+    # -- parser callbacks -----------------------------------------------------
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._field_name = None
+        self._field_value = bytearray()
+        self._filename = None
+        self._writer = None
+        self._error = None
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, params = parse_options_header(
+            self._headers.get(b"content-disposition", b"")
+        )
+        name = params.get(b"name", b"").decode("utf-8", "replace")
+        filename = params.get(b"filename")
+        if filename is None:
+            self._field_name = name
+            return
+
+        self._filename = os.path.basename(filename.decode("utf-8", "replace"))
+        ext = Path(self._filename).suffix.lower()
+        if ext not in self._allowed:
+            allowed = ", ".join(sorted(self._allowed))
+            self._error = f"Only {allowed} files are accepted"
+            return
+        if not all(self._fields.get(name) for name in _FIELDS):
+            self._error = "systemName and recordingUser must precede file parts"
+            return
+        try:
+            self._writer = storage.StagedUpload(
+                self._root,
+                self._filename,
+                recording_user=self._fields.get("recordingUser"),
+                system_name=self._fields.get("systemName"),
+            )
+        except OSError as exc:
+            self._error = f"Could not open staging file: {exc}"
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._writer is not None:
+            started = time.perf_counter()
+            try:
+                self._writer.write(data[start:end])
+                timing.add("write", time.perf_counter() - started)
+            except OSError as exc:
+                self._writer.abort()
+                self._writer = None
+                self._error = f"Write failed: {exc}"
+        elif self._field_name is not None:
+            if len(self._field_value) + (end - start) <= _MAX_FIELD_BYTES:
+                self._field_value += data[start:end]
+
+    def _on_part_end(self) -> None:
+        if self._filename is None:
+            if self._field_name in _FIELDS:
+                self._fields[self._field_name] = self._field_value.decode(
+                    "utf-8", "replace"
+                )
+            return
+
+        if self._writer is None:
+            self._record_failure(self._error or "upload failed")
+            return
+
+        writer, self._writer = self._writer, None
+        started = time.perf_counter()
+        try:
+            saved = writer.commit()
+        except OSError as exc:
+            self._record_failure(f"Commit failed: {exc}")
+            return
+        finally:
+            timing.add("close", time.perf_counter() - started)
+        _LOGGER.info(
+            "Stored batch upload from system=%s user=%s at %s",
+            self._fields.get("systemName"),
+            self._fields.get("recordingUser"),
+            saved,
+            extra={"skip_file": True},
+        )
+        self.results.append(
+            {"filename": self._filename, "ok": True, "saved_to": str(saved)}
+        )
+
+    def _record_failure(self, error: str) -> None:
+        _LOGGER.warning(
+            "Rejected batch upload %s from system=%s user=%s: %s",
+            self._filename,
+            self._fields.get("systemName"),
+            self._fields.get("recordingUser"),
+            error,
+        )
+        self.results.append({"filename": self._filename, "ok": False, "error": error})
@@ -0,0 +1,438 @@
+# Bulk uploader for pushing recordings into a Manager from Python.
+#
+#   python Apps/Manager/client.py --url http://manager:8080 --token TOKEN \
+#       --system-name PC-042 --workers 4 --state upload-state.json D:\recordings
+#
+# The source directory is laid out like the recorder's record_dir:
+#   <record_dir>/<record_subdir>/<segment>.mkv
+# and, like the recorder, the subdirectory name is sent as recordingUser
+# (record_dir's own name for files that sit directly inside it).
+# Each worker thread keeps one keep-alive connection open for all its uploads,
+# failed uploads are retried with exponential backoff, and completed files are
+# appended to the state journal so an interrupted run can be resumed.
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import logging
+import os
+import random
+import socket
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+_LOGGER = logging.getLogger("manager.client")
+_CHUNK_SIZE = 1024 * 1024
+_RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class UploadError(Exception):
+    def __init__(self, message: str, retryable: bool) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+@dataclass(frozen=True)
+class Recording:
+    path: Path
+    recording_user: str
+    size: int
+    mtime_ns: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.recording_user}/{self.path.name}|{self.size}|{self.mtime_ns}"
+
+
+def iter_recordings(
+    record_dir: Path, ext: str = ".mkv", min_age: float = 0.0
+) -> Iterator[Recording]:
+    """
+    Yield segments under record_dir, oldest first. Files modified within the
+    last min_age seconds are skipped because the recorder may still be writing
+    them. Files directly under record_dir are labelled with its name, as the
+    recorder does.
+    """
+    cutoff = time.time() - min_age
+    record_name = record_dir.resolve().name
+    found: List[Recording] = []
+    for path in record_dir.rglob(f"*{ext}"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        if not path.is_file() or st.st_mtime > cutoff:
+            continue
+        parent = path.parent
+        user = parent.name if parent != record_dir else record_name
+        found.append(Recording(path, user, st.st_size, st.st_mtime_ns))
+    found.sort(key=lambda r: r.mtime_ns)
+    return iter(found)
+
+
+class ResumeState:
+    """
+    Completed uploads, kept in an append-only journal: one JSON line per
+    finished file, flushed as it is written and replayed on start-up. A line
+    cut short by a crash is ignored. compact() rewrites the journal with one
+    line per key.
+    """
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._done: Dict[str, str] = {}
+        self._journal = None
+        if path is None:
+            return
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self._done[entry["key"]] = entry["saved_to"]
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        self._journal = open(path, "a", encoding="utf-8")
+
+    def is_done(self, rec: Recording) -> bool:
+        with self._lock:
+            return rec.key in self._done
+
+    def mark_done(self, rec: Recording, saved_to: str) -> None:
+        line = json.dumps({"key": rec.key, "saved_to": saved_to}) + "\n"
+        with self._lock:
+            self._done[rec.key] = saved_to
+            if self._journal is not None:
+                self._journal.write(line)
+                self._journal.flush()
+
+    def compact(self) -> None:
+        with self._lock:
+            if self._journal is None:
+                return
+            self._journal.close()
+            tmp = self._path.with_name(self._path.name + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                for key, saved_to in self._done.items():
+                    f.write(json.dumps({"key": key, "saved_to": saved_to}) + "\n")
+            os.replace(tmp, self._path)
+            self._journal = open(self._path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+
+def _file_chunks(path: Path) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+class UploadClient:
+    """
+    Uploads segments over a single persistent HTTP connection. Not
+    thread-safe; give each worker its own instance.
+    """
+
+    def __init__(self, base_url: str, token: str, timeout: float = 300.0) -> None:
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme in {base_url!r}")
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._prefix = parts.path.rstrip("/")
+        if self._prefix.endswith("/upload"):
+            self._prefix = self._prefix[: -len("/upload")]
+        self._token = token
+        self._timeout = timeout
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            cls = (
+                http.client.HTTPSConnection
+                if self._scheme == "https"
+                else http.client.HTTPConnection
+            )
+            self._conn = cls(self._netloc, timeout=self._timeout)
+        return self._conn
+
+    def _post_multipart(
+        self, endpoint: str, fields: List[Tuple[str, str]], files: List[Recording]
+    ) -> dict:
+        boundary = uuid.uuid4().hex
+        pieces: List[object] = []
+        for name, value in fields:
+            pieces.append(
+                (
+                    f"--{boundary}\r\n"
+                    f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                    f"{value}\r\n"
+                ).encode("utf-8")
+            )
+        for rec in files:
+            pieces.append(
+                (
+                    f"--{boundary}\r\n"
+                    "Content-Disposition: form-data; "
+                    f'name="file"; filename="{rec.path.name}"\r\n'
+                    "Content-Type: application/octet-stream\r\n\r\n"
+                ).encode("utf-8")
+            )
+            pieces.append(rec)
+            pieces.append(b"\r\n")
+        pieces.append(f"--{boundary}--\r\n".encode("utf-8"))
+
+        length = sum(p.size if isinstance(p, Recording) else len(p) for p in pieces)
+
+        def _body() -> Iterator[bytes]:
+            for p in pieces:
+                if isinstance(p, Recording):
+                    yield from _file_chunks(p.path)
+                else:
+                    yield p
+
+        headers = {
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(length),
+            "Connection": "keep-alive",
+        }
+        if self._token:
+            headers["Authorization"] = f"Bearer {self._token}"
+
+        conn = self._connection()
+        try:
+            conn.request("POST", self._prefix + endpoint, body=_body(), headers=headers)
+            resp = conn.getresponse()
+            payload = resp.read()
+        except (OSError, http.client.HTTPException) as exc:
+            # Stale keep-alive connection or network failure; reconnect next time.
+            self.close()
+            raise UploadError(f"{type(exc).__name__}: {exc}", retryable=True) from exc
+
+        if resp.will_close:
+            self.close()
+        if resp.status != 200:
+            raise UploadError(
+                f"HTTP {resp.status}: {payload[:200]!r}",
+                retryable=resp.status in _RETRYABLE_STATUS,
+            )
+        return json.loads(payload)
+
+    def upload(self, rec: Recording, system_name: str) -> str:
+        fields = [("systemName", system_name)]
+        if rec.recording_user:
+            fields.append(("recordingUser", rec.recording_user))
+        return self._post_multipart("/upload", fields, [rec])["saved_to"]
+
+    def upload_batch(
+        self, recs: List[Recording], system_name: str
+    ) -> List[Tuple[Recording, Optional[str], Optional[str]]]:
+        """
+        Send recs (which must share a recording user) in one /upload/batch
+        request. Returns (recording, saved_to, error) for each file.
+        """
+        fields = [("systemName", system_name)]
+        if recs[0].recording_user:
+            fields.append(("recordingUser", recs[0].recording_user))
+        result = self._post_multipart("/upload/batch", fields, recs)
+        items = result.get("results", [])
+        out = []
+        for i, rec in enumerate(recs):
+            item = items[i] if i < len(items) else {"error": "no result returned"}
+            if item.get("ok"):
+                out.append((rec, item["saved_to"], None))
+            else:
+                out.append((rec, None, item.get("error", "upload failed")))
+        return out
+
+
+def _with_retries(fn, retries: int, backoff: float, what: str):
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except UploadError as exc:
+            attempt += 1
+            if not exc.retryable or attempt > retries:
+                raise
+            delay = backoff * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+            _LOGGER.warning(
+                "%s failed (%s); retry %s/%s in %.1fs",
+                what,
+                exc,
+                attempt,
+                retries,
+                delay,
+            )
+            time.sleep(delay)
+
+
+def _batches(recs: Iterable[Recording], size: int) -> Iterator[List[Recording]]:
+    batch: List[Recording] = []
+    for rec in recs:
+        if batch and (
+            len(batch) >= size or rec.recording_user != batch[0].recording_user
+        ):
+            yield batch
+            batch = []
+        batch.append(rec)
+    if batch:
+        yield batch
+
+
+def run(
+    record_dir: Path,
+    base_url: str,
+    token: str,
+    system_name: str,
+    workers: int = 4,
+    batch_size: int = 1,
+    retries: int = 5,
+    backoff: float = 1.0,
+    min_age: float = 60.0,
+    state_path: Optional[Path] = None,
+) -> Dict[str, int]:
+    """Upload every pending segment under record_dir; returns counters."""
+    state = ResumeState(state_path)
+    pending = [r for r in iter_recordings(record_dir, min_age=min_age)]
+    todo = [r for r in pending if not state.is_done(r)]
+    stats = {"found": len(pending), "skipped": len(pending) - len(todo)}
+    stats.update({"uploaded": 0, "failed": 0, "bytes": 0})
+    stats_lock = threading.Lock()
+    local = threading.local()
+    clients: List[UploadClient] = []
+
+    def _client() -> UploadClient:
+        client = getattr(local, "client", None)
+        if client is None:
+            client = UploadClient(base_url, token)
+            local.client = client
+            with stats_lock:
+                clients.append(client)
+        return client
+
+    def _record(rec: Recording, saved_to: Optional[str], error: Optional[str]) -> None:
+        if saved_to is not None:
+            state.mark_done(rec, saved_to)
+        with stats_lock:
+            if saved_to is not None:
+                stats["uploaded"] += 1
+                stats["bytes"] += rec.size
+            else:
+                stats["failed"] += 1
+        if error is not None:
+            _LOGGER.error("Upload failed for %s: %s", rec.path, error)
+
+    def _send(batch: List[Recording]) -> None:
+        what = batch[0].path.name if len(batch) == 1 else f"batch of {len(batch)}"
+        try:
+            if batch_size <= 1:
+                rec = batch[0]
+                saved = _with_retries(
+                    lambda: _client().upload(rec, system_name), retries, backoff, what
+                )
+                _record(rec, saved, None)
+            else:
+                results = _with_retries(
+                    lambda: _client().upload_batch(batch, system_name),
+                    retries,
+                    backoff,
+                    what,
+                )
+                for rec, saved, error in results:
+                    _record(rec, saved, error)
+        except UploadError as exc:
+            for rec in batch:
+                _record(rec, None, str(exc))
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = [pool.submit(_send, b) for b in _batches(todo, batch_size)]
+            for fut in as_completed(futures):
+                fut.result()
+    finally:
+        for client in clients:
+            client.close()
+        try:
+            state.compact()
+        finally:
+            state.close()
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Upload a recorder-style directory of segments to a Manager."
+    )
+    parser.add_argument("record_dir", type=Path)
+    parser.add_argument("--url", required=True, help="Manager base URL")
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("SRS_UPLOAD_TOKEN", ""),
+        help="bearer token (default: $SRS_UPLOAD_TOKEN)",
+    )
+    parser.add_argument("--system-name", default=socket.gethostname())
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="files per request; above 1 uses /upload/batch",
+    )
+    parser.add_argument("--retries", type=int, default=5)
+    parser.add_argument(
+        "--backoff", type=float, default=1.0, help="initial retry delay (seconds)"
+    )
+    parser.add_argument(
+        "--min-age",
+        type=float,
+        default=60.0,
+        help="skip files modified within this many seconds",
+    )
+    parser.add_argument("--state", type=Path, help="resume state file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    started = time.monotonic()
+    stats = run(
+        args.record_dir,
+        args.url,
+        args.token,
+        args.system_name,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        retries=args.retries,
+        backoff=args.backoff,
+        min_age=args.min_age,
+        state_path=args.state,
+    )
+    stats["elapsed_s"] = round(time.monotonic() - started, 3)
+    print(json.dumps(stats))
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import configparser
 import logging
+import os
 import sys
 import threading
 import time
@@ -11,14 +12,25 @@ from pathlib import Path
 from typing import Callable, List, Optional
 
 _LOGGER = logging.getLogger("manager.config")
+_INI_ENV_VAR = "SRS_MANAGER_INI"
 
 
 def _find_manager_ini() -> Path:
     """
     Search order:
+      0) The path in the SRS_MANAGER_INI environment variable, if set.
       1) Next to the running binary/module.
       2) ../../Configs/Manager.ini when running from source.
     """
+    override = os.environ.get(_INI_ENV_VAR, "").strip()
+    if override:
+        override_ini = Path(override)
+        if not override_ini.exists():
+            raise FileNotFoundError(
+                f"{_INI_ENV_VAR} points to a missing file: {override_ini}"
+            )
+        return override_ini
+
     if getattr(sys, "frozen", False):
         base_dir = Path(sys.executable).resolve().parent
     else:
@@ -58,6 +70,34 @@ def _parse_duration(raw: str) -> timedelta:
     return timedelta(seconds=int(s))
 
 
+def _parse_size(raw: str) -> int:
+    """Parse sizes/rates such as '512K', '20MB', '1G/s' into bytes."""
+    s = raw.strip().upper()
+    if s.endswith("/S"):
+        s = s[:-2]
+    if s.endswith("B"):
+        s = s[:-1]
+    for suffix, factor in (("K", 1024), ("M", 1024**2), ("G", 1024**3)):
+        if s.endswith(suffix):
+            return int(float(s[:-1]) * factor)
+    return int(s or 0)
+
+
+def _parse_path(raw: str, base_dir: Path) -> Optional[Path]:
+    s = raw.strip()
+    if not s:
+        return None
+    p = Path(s)
+    if not p.is_absolute():
+        p = base_dir / p
+    return p.resolve()
+
+
+def _paths_overlap(a: Path, b: Path) -> bool:
+    """True if a and b are the same directory or one contains the other."""
+    return a == b or a in b.parents or b in a.parents
+
+
 @dataclass(frozen=True)
 class Cfg:
     bind_host: str
@@ -66,6 +106,15 @@ class Cfg:
     gc_interval: timedelta
     retention: timedelta
     source_path: Path
+    hot_root: Optional[Path] = None
+    cold_root: Optional[Path] = None
+    tier_after: timedelta = timedelta(days=1)
+    tier_interval: timedelta = timedelta(hours=1)
+    tier_bandwidth: int = 0
+    scrub_interval: timedelta = timedelta(0)
+    scrub_bandwidth: int = 0
+    request_timing: bool = False
+    slow_request_threshold: timedelta = timedelta(seconds=10)
 
 
 class ConfigManager:
@@ -97,6 +146,38 @@ class ConfigManager:
         gc_interval = _parse_duration(sect.get("gc_interval", "1h"))
         retention = _parse_duration(sect.get("retention", "24h"))
 
+        tier = parser["tiering"] if parser.has_section("tiering") else {}
+        base_dir = self._config_path.parent
+        hot_root = _parse_path(tier.get("hot_root", ""), base_dir)
+        cold_root = _parse_path(tier.get("cold_root", ""), base_dir)
+        if cold_root is not None:
+            from . import storage
+
+            effective_hot = hot_root or storage.recordings_root(create=False).resolve()
+            if _paths_overlap(cold_root, effective_hot):
+                _LOGGER.error(
+                    "[tiering].cold_root (%s) overlaps the hot root (%s); "
+                    "tiering disabled.",
+                    cold_root,
+                    effective_hot,
+                )
+                cold_root = None
+        tier_after = _parse_duration(tier.get("move_after", "1d"))
+        tier_interval = _parse_duration(tier.get("interval", "1h"))
+        tier_bandwidth = _parse_size(tier.get("bandwidth", "0"))
+
+        scrub = parser["scrub"] if parser.has_section("scrub") else {}
+        scrub_interval = _parse_duration(scrub.get("interval", "0"))
+        scrub_bandwidth = _parse_size(scrub.get("bandwidth", "0"))
+
+        diag = parser["diagnostics"] if parser.has_section("diagnostics") else None
+        request_timing = (
+            diag.getboolean("request_timing", fallback=False) if diag else False
+        )
+        slow_request_threshold = _parse_duration(
+            diag.get("slow_request_threshold", "10s") if diag else "10s"
+        )
+
         return Cfg(
             bind_host=bind_host,
             bind_port=bind_port,
@@ -104,6 +185,15 @@ class ConfigManager:
             gc_interval=gc_interval,
             retention=retention,
             source_path=self._config_path,
+            hot_root=hot_root,
+            cold_root=cold_root,
+            tier_after=tier_after,
+            tier_interval=tier_interval,
+            tier_bandwidth=tier_bandwidth,
+            scrub_interval=scrub_interval,
+            scrub_bandwidth=scrub_bandwidth,
+            request_timing=request_timing,
+            slow_request_threshold=slow_request_threshold,
         )
 
     def get_cfg(self) -> Cfg:
@@ -166,17 +256,30 @@ class ConfigManager:
                     _LOGGER.exception("Config change listener raised an exception.")
 
 
-_manager = ConfigManager()
+# Created on first use so that importing the package stays cheap and does not
+# touch the filesystem or start the watcher thread.
+_manager: Optional[ConfigManager] = None
+_manager_lock = threading.Lock()
+
+
+def _get_manager() -> ConfigManager:
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = ConfigManager()
+    return _manager
 
 
 def get_cfg() -> Cfg:
-    return _manager.get_cfg()
+    return _get_manager().get_cfg()
 
 
 def add_listener(callback: Callable[[Cfg, bool], None]) -> Callable[[], None]:
-    return _manager.add_listener(callback)
+    return _get_manager().add_listener(callback)
 
 
 def stop_watcher() -> None:
-    _manager.stop()
+    if _manager is not None:
+        _manager.stop()
 
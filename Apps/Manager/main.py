@@ -9,28 +9,24 @@ import sys
 import threading
 import traceback
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-try:
-    import servicemanager  # type: ignore
-    import win32service  # type: ignore
-    import win32serviceutil  # type: ignore
-except ImportError:  # pragma: no cover - pywin32 not installed
-    servicemanager = None
-    win32service = None
-    win32serviceutil = None
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 if __package__ is None:  # running as a script: ensure Apps/ is on sys.path
     sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-import uvicorn
 from Manager import config
 from Manager import logging_utils as _logging_utils  # noqa: F401
-from Manager.server import app as manager_app
 
+if TYPE_CHECKING:
+    import uvicorn
+
+# uvicorn, the FastAPI app and pywin32 are imported only once the run mode is
+# known; see _build_server() and _service_class().
 _LOGGER = logging.getLogger("manager.service")
 _RUN_MODE: str = "unknown"
 _SHUTDOWN_ONCE = threading.Event()
+_LOGGING_CONFIGURED = False
+_SERVICE_CLASS: Optional[type] = None
 
 
 class SkipSuccessfulUploads(logging.Filter):
@@ -145,15 +141,27 @@ def _build_log_config() -> Dict[str, Any]:
     }
 
 
+def _configure_logging() -> None:
+    """Apply the logging config once per process; restarts reuse it."""
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    logging.config.dictConfig(_build_log_config())
+    _LOGGING_CONFIGURED = True
+
+
 def _build_server(current_cfg: Optional[config.Cfg] = None) -> uvicorn.Server:
-    log_config = _build_log_config()
-    logging.config.dictConfig(log_config)
+    import uvicorn
+
+    from Manager.server import app as manager_app
+
+    _configure_logging()
     cfg_obj = current_cfg or config.get_cfg()
     uv_config = uvicorn.Config(
         manager_app,
         host=cfg_obj.bind_host,
         port=cfg_obj.bind_port,
-        log_config=log_config,
+        log_config=None,
         log_level="info",
         loop="asyncio",
         lifespan="on",
@@ -206,10 +214,25 @@ def run_server() -> None:
 
 
 def _service_capable() -> bool:
-    return win32serviceutil is not None
+    try:
+        import win32serviceutil  # type: ignore  # noqa: F401
+    except ImportError:  # pragma: no cover - pywin32 not installed
+        return False
+    return True
+
 
+def _service_class() -> type:
+    """
+    Define the Windows service class on first use so that pywin32 is only
+    imported for service commands.
+    """
+    global _SERVICE_CLASS
+    if _SERVICE_CLASS is not None:
+        return _SERVICE_CLASS
 
-if _service_capable():
+    import servicemanager  # type: ignore
+    import win32service  # type: ignore
+    import win32serviceutil  # type: ignore
 
     class SRSManagerService(win32serviceutil.ServiceFramework):  # type: ignore[misc]
         _svc_name_ = "SRSManager"
@@ -280,6 +303,16 @@ if _service_capable():
             finally:
                 self.ReportServiceStatus(win32service.SERVICE_STOPPED)  # type: ignore[attr-defined]
 
+    _SERVICE_CLASS = SRSManagerService
+    return _SERVICE_CLASS
+
+
+def __getattr__(name: str) -> Any:
+    # pythonservice.exe resolves the service class by attribute name.
+    if name == "SRSManagerService" and _service_capable():
+        return _service_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def main() -> None:
     global _RUN_MODE
@@ -295,16 +328,20 @@ def main() -> None:
                 raise RuntimeError(
                     "pywin32 is required to run SRS Manager as a service."
                 )
+            import servicemanager  # type: ignore
+
             _RUN_MODE = "service"
             servicemanager.Initialize()  # type: ignore[attr-defined]
-            servicemanager.PrepareToHostSingle(SRSManagerService)  # type: ignore[attr-defined]
+            servicemanager.PrepareToHostSingle(_service_class())  # type: ignore[attr-defined]
             servicemanager.StartServiceCtrlDispatcher()  # type: ignore[attr-defined]
             return
         if not _service_capable():
             raise RuntimeError(
                 "pywin32 is required to manage the SRS Manager Windows service."
             )
-        win32serviceutil.HandleCommandLine(SRSManagerService)  # type: ignore[arg-type]
+        import win32serviceutil  # type: ignore
+
+        win32serviceutil.HandleCommandLine(_service_class())  # type: ignore[arg-type]
         return
 
     # Default to console mode when no arguments are supplied
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Optional
+
+from . import storage
+
+_CHUNK_SIZE = 1024 * 1024
+_BUSY_BACKOFF_SECONDS = 5.0
+
+_EBML_ID = 0x1A45DFA3
+_SEGMENT_ID = 0x18538067
+
+
+@dataclass
+class ScrubFailure:
+    path: str
+    quarantined_to: str
+    reason: str
+    detected_at: str
+
+
+@dataclass
+class ScrubReport:
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    scanned: int = 0
+    scanned_bytes: int = 0
+    failures: List[ScrubFailure] = field(default_factory=list)
+
+
+class _Interrupted(Exception):
+    pass
+
+
+def _read_vint(f: BinaryIO, keep_marker: bool) -> tuple[int, int, bool]:
+    """
+    Read an EBML variable-length integer. Returns (value, length, unknown)
+    where unknown is True for the reserved all-ones "unknown size" value.
+    """
+    first = f.read(1)
+    if not first:
+        raise EOFError
+    b0 = first[0]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not (b0 & mask):
+        mask >>= 1
+        length += 1
+    if length > 8:
+        raise ValueError("invalid EBML length marker")
+    rest = f.read(length - 1)
+    if len(rest) != length - 1:
+        raise EOFError
+    value = b0 if keep_marker else b0 & (mask - 1)
+    for b in rest:
+        value = (value << 8) | b
+    unknown = not keep_marker and value == (1 << (7 * length)) - 1
+    return value, length, unknown
+
+
+def check_mkv(path: Path) -> Optional[str]:
+    """
+    Structural Matroska check: the file must start with an EBML header followed
+    by a Segment whose top-level children fit exactly inside the file. Returns
+    a failure reason, or None when the file looks intact.
+    """
+    size = path.stat().st_size
+    with open(path, "rb") as f:
+        try:
+            elem_id, _, _ = _read_vint(f, keep_marker=True)
+            if elem_id != _EBML_ID:
+                return "missing EBML header"
+            header_size, _, _ = _read_vint(f, keep_marker=False)
+            f.seek(header_size, 1)
+
+            elem_id, _, _ = _read_vint(f, keep_marker=True)
+            if elem_id != _SEGMENT_ID:
+                return "missing Segment element"
+            seg_size, _, seg_unknown = _read_vint(f, keep_marker=False)
+            pos = f.tell()
+            end = size if seg_unknown else pos + seg_size
+            if end > size:
+                return f"truncated Segment ({size} of {end} bytes present)"
+
+            while pos < end:
+                f.seek(pos)
+                _read_vint(f, keep_marker=True)
+                child_size, _, child_unknown = _read_vint(f, keep_marker=False)
+                if child_unknown:
+                    # Live-muxed element without a size; nothing more to verify.
+                    return None
+                pos = f.tell() + child_size
+                if pos > end:
+                    return f"truncated element ending at byte {pos} of {end}"
+        except EOFError:
+            return "unexpected end of file"
+        except ValueError as exc:
+            return str(exc)
+    return None
+
+
+def _read_throttled(
+    path: Path,
+    bytes_per_sec: int,
+    stop_event: Optional[threading.Event],
+    is_busy: Optional[Callable[[], bool]],
+) -> int:
+    """
+    Read the whole file to surface I/O errors, capped at bytes_per_sec and
+    pausing while is_busy() reports active ingest. Returns bytes read.
+    """
+
+    def _wait(seconds: float) -> None:
+        if stop_event is not None:
+            if stop_event.wait(seconds):
+                raise _Interrupted
+        else:
+            time.sleep(seconds)
+
+    started = time.monotonic()
+    total = 0
+    window_start = 0
+    with open(path, "rb") as f:
+        while True:
+            while is_busy is not None and is_busy():
+                _wait(_BUSY_BACKOFF_SECONDS)
+                # Restart the rate window so the pause is not "spent" as credit.
+                started = time.monotonic()
+                window_start = total
+            chunk = f.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            total += len(chunk)
+            if bytes_per_sec > 0:
+                window_bytes = total - window_start
+                delay = window_bytes / bytes_per_sec - (time.monotonic() - started)
+                if delay > 0:
+                    _wait(delay)
+            elif stop_event is not None and stop_event.is_set():
+                raise _Interrupted
+    return total
+
+
+def scrub_tree(
+    storage_root: Path,
+    report: ScrubReport,
+    bytes_per_sec: int = 0,
+    stop_event: Optional[threading.Event] = None,
+    is_busy: Optional[Callable[[], bool]] = None,
+) -> int:
+    """
+    Re-read every .mkv segment under storage_root and quarantine the ones that
+    fail to read or fail check_mkv(). Progress and failures are recorded on
+    report. Returns the number of quarantined files.
+    """
+    if not storage_root.exists():
+        return 0
+
+    quarantined = 0
+    for p in storage.iter_segments(storage_root):
+        if stop_event is not None and stop_event.is_set():
+            break
+        if p.suffix.lower() != ".mkv":
+            continue
+        try:
+            report.scanned_bytes += _read_throttled(
+                p, bytes_per_sec, stop_event, is_busy
+            )
+            reason = check_mkv(p)
+        except _Interrupted:
+            break
+        except FileNotFoundError:
+            # Rotated or tiered away while we were looking at it.
+            continue
+        except OSError as exc:
+            reason = f"read error: {exc}"
+        report.scanned += 1
+        if reason is None:
+            continue
+
+        try:
+            target = storage.quarantine(storage_root, p)
+        except Exception:
+            continue
+        quarantined += 1
+        report.failures.append(
+            ScrubFailure(
+                path=str(p),
+                quarantined_to=str(target),
+                reason=reason,
+                detected_at=datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            )
+        )
+
+    return quarantined
@@ -1,24 +1,112 @@
 import asyncio
 import logging
+import threading
+import time
 from contextlib import suppress
+from dataclasses import asdict
+from datetime import datetime
 from pathlib import Path
 
-from fastapi import FastAPI, File, Form, Header, HTTPException, UploadFile, status
+from fastapi import (
+    FastAPI,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from starlette.requests import ClientDisconnect
 
-from . import auth, storage, config
+from . import auth, batch, storage, config, scrub, tiering, timing
 
 logger = logging.getLogger("manager.server")
 
 app = FastAPI()
 _gc_task: asyncio.Task | None = None
+_tier_task: asyncio.Task | None = None
+_tier_stop = threading.Event()
+_scrub_task: asyncio.Task | None = None
+_scrub_stop = threading.Event()
+_scrub_report = scrub.ScrubReport()
+_scrub_running = False
+_active_uploads = 0
+_last_upload_done = 0.0
+_INGEST_QUIET_SECONDS = 2.0
 _ALLOWED_EXTS = {".mkv"}
 
 
+class _IngestTracker:
+    """
+    ASGI middleware that counts in-flight /upload requests from the first
+    byte, so background work also backs off while a body is still being
+    received and spooled, before any handler runs.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith("/upload"):
+            await self.app(scope, receive, send)
+            return
+        global _active_uploads, _last_upload_done
+        _active_uploads += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _active_uploads -= 1
+            _last_upload_done = time.monotonic()
+
+
+app.add_middleware(timing.TimingMiddleware)
+app.add_middleware(_IngestTracker)
+
+
+def _hot_root(cfg: config.Cfg) -> Path:
+    if cfg.hot_root is None:
+        return storage.recordings_root()
+    return storage.ensure_dir(cfg.hot_root)
+
+
+def _storage_roots(cfg: config.Cfg) -> list[Path]:
+    """All tiers that may hold segments, hot first."""
+    roots = [_hot_root(cfg)]
+    if cfg.cold_root is not None and cfg.cold_root not in roots:
+        roots.append(cfg.cold_root)
+    return roots
+
+
+def _ingest_busy() -> bool:
+    """True while uploads are in flight or finished only moments ago."""
+    if _active_uploads > 0:
+        return True
+    return time.monotonic() - _last_upload_done < _INGEST_QUIET_SECONDS
+
+
+def _utc_stamp() -> str:
+    return datetime.utcnow().isoformat(timespec="seconds") + "Z"
+
+
+def _rotate_all(cfg: config.Cfg) -> int:
+    return sum(
+        storage.rotate_by_age(root, cfg.retention) for root in _storage_roots(cfg)
+    )
+
+
 @app.on_event("startup")
 async def _startup():
-    global _gc_task
-    recordings_root = storage.recordings_root()
+    global _gc_task, _tier_task, _scrub_task
     cfg = config.get_cfg()
+    recordings_root = _hot_root(cfg)
+    discarded = sum(storage.recover_staging(root) for root in _storage_roots(cfg))
+    if discarded:
+        logger.warning(
+            "Discarded %s incomplete upload(s) left over from a previous run",
+            discarded,
+        )
     logger.info(
         "Manager starting on %s:%s; recordings stored under %s",
         cfg.bind_host,
@@ -30,7 +118,7 @@ async def _startup():
         while True:
             try:
                 current_cfg = config.get_cfg()
-                deleted = storage.rotate_by_age(recordings_root, current_cfg.retention)
+                deleted = await asyncio.to_thread(_rotate_all, current_cfg)
                 if deleted:
                     logger.info("GC removed %s expired recording(s)", deleted)
             except Exception:
@@ -40,18 +128,84 @@ async def _startup():
                 max(current_cfg.gc_interval.total_seconds(), 1)
             )
 
+    async def _tier_loop():
+        while True:
+            current_cfg = config.get_cfg()
+            if current_cfg.cold_root is not None:
+                try:
+                    moved = await asyncio.to_thread(
+                        tiering.migrate_by_age,
+                        _hot_root(current_cfg),
+                        current_cfg.cold_root,
+                        current_cfg.tier_after,
+                        current_cfg.tier_bandwidth,
+                        _tier_stop,
+                    )
+                    if moved:
+                        logger.info(
+                            "Tiering moved %s recording(s) to cold storage", moved
+                        )
+                except Exception:
+                    logger.exception("Tiering pass failed")
+            await asyncio.sleep(
+                max(current_cfg.tier_interval.total_seconds(), 1)
+            )
+
+    async def _scrub_loop():
+        global _scrub_report, _scrub_running
+        while True:
+            current_cfg = config.get_cfg()
+            interval = current_cfg.scrub_interval.total_seconds()
+            if interval <= 0:
+                await asyncio.sleep(60)
+                continue
+            report = scrub.ScrubReport(started_at=_utc_stamp())
+            _scrub_report = report
+            _scrub_running = True
+            try:
+                for root in _storage_roots(current_cfg):
+                    quarantined = await asyncio.to_thread(
+                        scrub.scrub_tree,
+                        root,
+                        report,
+                        current_cfg.scrub_bandwidth,
+                        _scrub_stop,
+                        _ingest_busy,
+                    )
+                    if quarantined:
+                        logger.warning(
+                            "Scrubber quarantined %s damaged recording(s) under %s",
+                            quarantined,
+                            root,
+                        )
+            except Exception:
+                logger.exception("Scrub pass failed")
+            finally:
+                _scrub_running = False
+                report.finished_at = _utc_stamp()
+            await asyncio.sleep(max(interval, 1))
+
     _gc_task = asyncio.create_task(_gc_loop())
+    _tier_stop.clear()
+    _tier_task = asyncio.create_task(_tier_loop())
+    _scrub_stop.clear()
+    _scrub_task = asyncio.create_task(_scrub_loop())
 
 
 @app.on_event("shutdown")
 async def _shutdown():
-    global _gc_task
+    global _gc_task, _tier_task, _scrub_task
     logger.info("Manager shutting down")
-    if _gc_task and not _gc_task.done():
-        _gc_task.cancel()
-        with suppress(asyncio.CancelledError):
-            await _gc_task
+    _tier_stop.set()
+    _scrub_stop.set()
+    for task in (_gc_task, _tier_task, _scrub_task):
+        if task and not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
     _gc_task = None
+    _tier_task = None
+    _scrub_task = None
 
 
 @app.post("/upload")
@@ -61,6 +215,7 @@ async def upload(
     recordingUser: str = Form(...),
     authorization: str | None = Header(None),
 ):
+    timing.mark("parse")
     cfg = config.get_cfg()
     auth.validate_bearer(authorization, cfg.auth_token)
 
@@ -77,11 +232,16 @@ async def upload(
             status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
             detail=f"Only {allowed} files are accepted",
         )
+    timing.mark("validate")
 
-    saved = storage.save_upload_to_share(
-        upload_filename=file.filename,
-        computer_name=systemName,
-        user_session=recordingUser,
+    # The copy and fsync block; run them in a worker thread so a burst of
+    # uploads does not stall every other request.
+    saved = await asyncio.to_thread(
+        storage.save_upload,
+        _hot_root(cfg),
+        file.filename,
+        recording_user=recordingUser,
+        system_name=systemName,
         data_stream=file.file,
     )
     logger.info(
@@ -95,12 +255,83 @@ async def upload(
     return {"ok": True, "saved_to": str(saved)}
 
 
+@app.post("/upload/batch")
+async def upload_batch(request: Request, authorization: str | None = Header(None)):
+    """
+    Ingest many segments from one streamed multipart/form-data request. Set the
+    systemName and recordingUser fields first; every following file part is
+    written as it arrives. Returns a per-file result list.
+    """
+    cfg = config.get_cfg()
+    auth.validate_bearer(authorization, cfg.auth_token)
+    boundary = batch.multipart_boundary(request.headers.get("content-type"))
+    if not boundary:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Expected a multipart/form-data body",
+        )
+    timing.mark("validate")
+
+    ingest = batch.BatchUpload(_hot_root(cfg), boundary, _ALLOWED_EXTS)
+    try:
+        # Parsing, disk writes and the per-file fsync/rename all happen inside
+        # feed(); keep them off the event loop so other requests are served.
+        async for chunk in request.stream():
+            await asyncio.to_thread(ingest.feed, chunk)
+        results = await asyncio.to_thread(ingest.finish)
+    except ClientDisconnect:
+        await asyncio.to_thread(ingest.abort)
+        logger.warning(
+            "Batch upload client disconnected after storing %s file(s)",
+            sum(1 for r in ingest.results if r["ok"]),
+        )
+        # Nobody is listening any more; end the request quietly instead of
+        # letting Starlette turn the disconnect into a logged 500.
+        return Response(status_code=status.HTTP_400_BAD_REQUEST)
+    except Exception as exc:
+        await asyncio.to_thread(ingest.abort)
+        logger.warning("Malformed batch upload body: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "Malformed multipart body", "results": ingest.results},
+        )
+
+    stored = sum(1 for r in results if r["ok"])
+    logger.info(
+        "Batch upload stored %s of %s file(s)",
+        stored,
+        len(results),
+        extra={"skip_file": stored == len(results)},
+    )
+    return {"ok": stored == len(results), "stored": stored, "results": results}
+
+
 @app.post("/admin/gc")
 async def admin_gc(authorization: str | None = Header(None)):
     cfg = config.get_cfg()
     auth.validate_bearer(authorization, cfg.auth_token)
-    root = storage.recordings_root()
-    deleted = storage.rotate_by_age(root, cfg.retention)
+    timing.mark("validate")
+    deleted = await asyncio.to_thread(_rotate_all, cfg)
+    timing.mark("rotate")
     if deleted:
         logger.info("Manual GC removed %s expired recording(s)", deleted)
     return {"ok": True, "deleted": deleted}
+
+
+@app.get("/admin/scrub")
+async def admin_scrub(authorization: str | None = Header(None)):
+    cfg = config.get_cfg()
+    auth.validate_bearer(authorization, cfg.auth_token)
+    timing.mark("validate")
+    quarantined = [
+        str(p)
+        for root in _storage_roots(cfg)
+        for p in sorted(storage.quarantine_dir(root).rglob("*"))
+        if p.is_file()
+    ]
+    return {
+        "ok": True,
+        "running": _scrub_running,
+        "last_pass": asdict(_scrub_report),
+        "quarantined": quarantined,
+    }
@@ -5,9 +5,19 @@ import os
 import re
 import shutil
 import sys
+import uuid
+from typing import Iterator
+
+from . import timing
 
 _FILENAME_SAFE = re.compile(r"[^A-Za-z0-9._-]+")
 _SHARE_DIR_NAME = "Recordings"
+_STAGING_DIR_NAME = ".staging"
+_QUARANTINE_DIR_NAME = ".quarantine"
+_RESERVED_DIR_NAMES = {_STAGING_DIR_NAME, _QUARANTINE_DIR_NAME}
+_PART_SUFFIX = ".part"
+_ensured_dirs: set[Path] = set()
+_PRUNE_RETRIES = 3
 
 
 def _install_root() -> Path:
@@ -28,10 +38,62 @@ def recordings_root(create: bool = True) -> Path:
     """
     root = _install_root() / _SHARE_DIR_NAME
     if create:
-        root.mkdir(parents=True, exist_ok=True)
+        ensure_dir(root)
     return root
 
 
+def ensure_dir(path: Path) -> Path:
+    """
+    mkdir -p, skipped after the first success for a given path so hot paths
+    do not pay a filesystem call on every request.
+    """
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+    return path
+
+
+def staging_dir(storage_root: str | os.PathLike) -> Path:
+    """
+    Directory holding in-progress uploads. It lives inside the storage root so
+    that finished files can be moved into place with an atomic rename.
+    """
+    return Path(storage_root) / _STAGING_DIR_NAME
+
+
+def quarantine_dir(storage_root: str | os.PathLike) -> Path:
+    """
+    Directory holding segments that failed an integrity check. Its layout
+    mirrors the recordings tree and it is subject to the normal retention GC.
+    """
+    return Path(storage_root) / _QUARANTINE_DIR_NAME
+
+
+def iter_segments(storage_root: str | os.PathLike) -> Iterator[Path]:
+    """
+    Yield every stored segment under storage_root, skipping the staging and
+    quarantine areas.
+    """
+    root = Path(storage_root)
+    for dirpath, dirnames, filenames in os.walk(root):
+        if Path(dirpath) == root:
+            dirnames[:] = [d for d in dirnames if d not in _RESERVED_DIR_NAMES]
+        for name in filenames:
+            yield Path(dirpath) / name
+
+
+def quarantine(storage_root: str | os.PathLike, path: Path) -> Path:
+    """
+    Move a stored segment into the quarantine area, keeping its relative path.
+    Returns the new Path.
+    """
+    root = Path(storage_root)
+    target = quarantine_dir(root) / path.relative_to(root)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(path, target)
+    return target
+
+
 def safe_name(s: str | None, fallback: str = "unknown") -> str:
     if not s:
         return fallback
@@ -40,6 +102,83 @@ def safe_name(s: str | None, fallback: str = "unknown") -> str:
     return s[:128]  # keep paths tidy
 
 
+def move_into_place(part_path: Path, target: Path) -> None:
+    """
+    Rename a finished .part file onto target, creating target's directory right
+    before the rename. The GC sweep prunes empty directories, so the directory
+    is recreated if a sweep removed it in between.
+    """
+    for attempt in range(_PRUNE_RETRIES):
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.replace(part_path, target)
+            return
+        except FileNotFoundError:
+            if attempt == _PRUNE_RETRIES - 1 or not part_path.exists():
+                raise
+
+
+class StagedUpload:
+    """
+    An upload being written to the staging area. Data goes to a .part file and
+    is only renamed to its final name by commit(), once fully flushed, so a
+    crash never leaves a truncated segment in the recordings tree.
+    """
+
+    def __init__(
+        self,
+        storage_root: str | os.PathLike,
+        upload_filename: str,
+        recording_user: str | None,
+        system_name: str | None,
+    ) -> None:
+        system_label = safe_name(system_name, fallback="unknown-system")
+        user_label = safe_name(recording_user, fallback="unknown-user")
+        day = datetime.utcnow().strftime("%Y-%m-%d")
+
+        # The target directory is only created by commit(): while the body
+        # streams in, an empty directory would be pruned by the GC sweep.
+        target_dir = Path(storage_root) / system_label / user_label / day
+
+        # sanitize the filename too
+        fname = safe_name(
+            upload_filename,
+            fallback=f"segment_{int(datetime.utcnow().timestamp())}.mkv",
+        )
+        self.target_path = target_dir / fname
+
+        staging = staging_dir(storage_root)
+        self._part_path = staging / f"{uuid.uuid4().hex}{_PART_SUFFIX}"
+        for attempt in range(_PRUNE_RETRIES):
+            staging.mkdir(parents=True, exist_ok=True)
+            try:
+                self._file = open(self._part_path, "wb")
+                break
+            except FileNotFoundError:
+                if attempt == _PRUNE_RETRIES - 1:
+                    raise
+
+    def write(self, data: bytes) -> int:
+        return self._file.write(data)
+
+    def commit(self) -> Path:
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            move_into_place(self._part_path, self.target_path)
+        except BaseException:
+            self.abort()
+            raise
+        return self.target_path
+
+    def abort(self) -> None:
+        try:
+            self._file.close()
+        finally:
+            self._part_path.unlink(missing_ok=True)
+
+
 def save_upload(
     storage_root: str | os.PathLike,
     upload_filename: str,
@@ -50,26 +189,45 @@ def save_upload(
     """
     Save the uploaded file stream under:
       <storage_root>/<system_name>/<recording_user>/<YYYY-MM-DD>/<original_filename>
-    Returns the final Path.
+    The data is staged first (see StagedUpload). Returns the final Path.
     """
-    system_label = safe_name(system_name, fallback="unknown-system")
-    user_label = safe_name(recording_user, fallback="unknown-user")
-    day = datetime.utcnow().strftime("%Y-%m-%d")
+    staged = StagedUpload(storage_root, upload_filename, recording_user, system_name)
+    timing.mark("open")
 
-    target_dir = Path(storage_root) / system_label / user_label / day
-    target_dir.mkdir(parents=True, exist_ok=True)
+    # stream copy to the staging area, then move into place
+    try:
+        shutil.copyfileobj(data_stream, staged)
+    except BaseException:
+        staged.abort()
+        raise
+    timing.mark("write")
+    # "close" covers the fsync and creating the target directory for the rename.
+    target_path = staged.commit()
+    timing.mark("close")
 
-    # sanitize the filename too
-    fname = safe_name(
-        upload_filename, fallback=f"segment_{int(datetime.utcnow().timestamp())}.mkv"
-    )
-    target_path = target_dir / fname
+    return target_path
 
-    # stream copy to disk
-    with open(target_path, "wb") as f:
-        shutil.copyfileobj(data_stream, f)
 
-    return target_path
+def recover_staging(storage_root: str | os.PathLike) -> int:
+    """
+    Discard .part files left behind by uploads that were interrupted (e.g. the
+    manager crashed mid-write). Only the staging directory is inspected, so the
+    cost does not grow with the size of the recordings tree. Recorders keep a
+    segment locally until its upload succeeds, so interrupted uploads are
+    simply re-sent. Returns the count of discarded files.
+    """
+    staging = staging_dir(storage_root)
+    if not staging.is_dir():
+        return 0
+
+    discarded = 0
+    for p in staging.glob(f"*{_PART_SUFFIX}"):
+        try:
+            p.unlink(missing_ok=True)
+            discarded += 1
+        except Exception:
+            pass
+    return discarded
 
 
 def save_upload_to_share(
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from . import storage
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _throttled_copy(
+    src: Path,
+    dst: Path,
+    bytes_per_sec: int,
+    stop_event: threading.Event | None = None,
+) -> bool:
+    """
+    Copy src to dst, sleeping between chunks so the average rate stays under
+    bytes_per_sec (0 = unlimited). Returns False if stop_event fired first.
+    """
+    started = time.monotonic()
+    copied = 0
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                return False
+            chunk = fin.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            fout.write(chunk)
+            copied += len(chunk)
+            if bytes_per_sec > 0:
+                delay = copied / bytes_per_sec - (time.monotonic() - started)
+                if delay > 0:
+                    if stop_event is not None:
+                        if stop_event.wait(delay):
+                            return False
+                    else:
+                        time.sleep(delay)
+        fout.flush()
+        os.fsync(fout.fileno())
+    return True
+
+
+def move_segment(
+    src: Path,
+    hot_root: Path,
+    cold_root: Path,
+    bytes_per_sec: int = 0,
+    stop_event: threading.Event | None = None,
+) -> Path | None:
+    """
+    Move a single segment from the hot root to the same relative location under
+    the cold root. The copy goes through the cold root's staging area and keeps
+    the original mtime so retention still measures the segment's real age.
+    Returns the new Path, or None if the move was interrupted.
+    """
+    target = cold_root / src.relative_to(hot_root)
+    if target.resolve() == src.resolve():
+        raise ValueError(f"Refusing to move {src} onto itself")
+
+    staging = storage.staging_dir(cold_root)
+    staging.mkdir(parents=True, exist_ok=True)
+    part_path = staging / f"{uuid.uuid4().hex}.part"
+
+    try:
+        if not _throttled_copy(src, part_path, bytes_per_sec, stop_event):
+            part_path.unlink(missing_ok=True)
+            return None
+        st = src.stat()
+        os.utime(part_path, (st.st_atime, st.st_mtime))
+        storage.move_into_place(part_path, target)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    src.unlink(missing_ok=True)
+    return target
+
+
+def migrate_by_age(
+    hot_root: Path,
+    cold_root: Path,
+    older_than: timedelta,
+    bytes_per_sec: int = 0,
+    stop_event: threading.Event | None = None,
+) -> int:
+    """
+    Move every segment under hot_root whose mtime is older than 'older_than' to
+    cold_root, capped at bytes_per_sec. Empty directories left behind are
+    pruned by the regular GC sweep. Returns the number of moved files.
+    """
+    if not hot_root.exists():
+        return 0
+
+    cutoff = datetime.utcnow() - older_than
+    moved = 0
+
+    for p in storage.iter_segments(hot_root):
+        if stop_event is not None and stop_event.is_set():
+            return moved
+        try:
+            mtime = datetime.utcfromtimestamp(p.stat().st_mtime)
+            if mtime >= cutoff:
+                continue
+            if move_segment(p, hot_root, cold_root, bytes_per_sec, stop_event):
+                moved += 1
+        except Exception:
+            # Leave the segment on the hot root; the next pass retries it.
+            pass
+
+    return moved
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import time
+from typing import Callable, List, Optional, Tuple
+
+from . import config
+
+_LOGGER = logging.getLogger("manager.timing")
+_TIMED_PREFIXES = ("/upload", "/admin/")
+
+_current: contextvars.ContextVar[Optional["RequestTimer"]] = contextvars.ContextVar(
+    "manager_request_timer", default=None
+)
+
+
+class RequestTimer:
+    """
+    Collects consecutive phase durations for one request. Each mark() closes
+    the phase that started at the previous mark (or at request start).
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases: List[Tuple[str, float]] = []
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def add(self, phase: str, secs: float) -> None:
+        """Accumulate secs into phase (for work repeated per file in a batch)."""
+        for i, (name, prev) in enumerate(self.phases):
+            if name == phase:
+                self.phases[i] = (name, prev + secs)
+                return
+        self.phases.append((phase, secs))
+
+    def total(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        parts = [f"{name};dur={secs * 1000:.1f}" for name, secs in self.phases]
+        parts.append(f"total;dur={self.total() * 1000:.1f}")
+        return ", ".join(parts)
+
+
+def mark(phase: str) -> None:
+    """Record the end of a phase on the active request timer, if any."""
+    timer = _current.get()
+    if timer is not None:
+        timer.mark(phase)
+
+
+def add(phase: str, secs: float) -> None:
+    """Add secs to a summed phase on the active request timer, if any."""
+    timer = _current.get()
+    if timer is not None:
+        timer.add(phase, secs)
+
+
+class TimingMiddleware:
+    """
+    ASGI middleware that, when [diagnostics].request_timing is enabled, times
+    /upload and /admin/* requests, adds a Server-Timing header and logs a
+    structured entry for requests slower than slow_request_threshold. When
+    disabled it forwards the request untouched.
+
+    Upload phases are "open" (the staging file), "write" and "close"; close
+    includes the fsync and creating the target directory before the rename.
+    /upload/batch writes files while the body streams in, so its write and
+    close entries are totals across all files and overlap the receive phase.
+    """
+
+    def __init__(self, app: Callable) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(_TIMED_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        cfg = config.get_cfg()
+        if not cfg.request_timing:
+            await self.app(scope, receive, send)
+            return
+
+        timer = RequestTimer()
+        token = _current.set(timer)
+        status = {"code": 0}
+
+        async def _receive():
+            message = await receive()
+            if message["type"] == "http.request" and not message.get("more_body"):
+                timer.mark("receive")
+            return message
+
+        async def _send(message) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (b"server-timing", timer.server_timing().encode("latin-1"))
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, _receive, _send)
+        finally:
+            _current.reset(token)
+            total = timer.total()
+            if total >= cfg.slow_request_threshold.total_seconds():
+                client = scope.get("client")
+                _LOGGER.warning(
+                    "Slow request: %s",
+                    json.dumps(
+                        {
+                            "method": scope["method"],
+                            "path": scope["path"],
+                            "status": status["code"],
+                            "client": client[0] if client else None,
+                            "total_ms": round(total * 1000, 1),
+                            "phases_ms": {
+                                name: round(secs * 1000, 1)
+                                for name, secs in timer.phases
+                            },
+                        }
+                    ),
+                )